@@ -2,12 +2,14 @@
 This module contains the parameters for the mindlessgen package.
 """
 
+import numpy as np
+
 MAX_ELEM = 86
 
 # Covalent radii (taken from Pyykko and Atsumi, Chem. Eur. J. 15, 2009, 188-197)
 # Values for metals decreased by 10%
 # D3 covalent radii used to construct the coordination number
-COV_RADII_PYYKKO = [
+_COV_RADII_PYYKKO_LIST = [
     0.32,
     0.46,  # H, He
     1.20,
@@ -128,7 +130,7 @@ COV_RADII_PYYKKO = [
     1.57,  # Nh-Og
 ]
 
-COV_RADII_MLMGEN = [
+_COV_RADII_MLMGEN_LIST = [
     0.42666663,
     0.6133333,
     1.59999996,
@@ -224,3 +226,19 @@ COV_RADII_MLMGEN = [
     2.05333315,
     2.06666647,
 ]
+
+# NumPy views of the radii for vectorized per-molecule lookups (radii[ati]).
+# The arrays keep the 0-based element indexing used throughout the package.
+# Frozen so that no caller can accidentally modify the reference data.
+COV_RADII_PYYKKO = np.asarray(_COV_RADII_PYYKKO_LIST, dtype=np.float64)
+COV_RADII_PYYKKO.setflags(write=False)
+COV_RADII_MLMGEN = np.asarray(_COV_RADII_MLMGEN_LIST, dtype=np.float64)
+COV_RADII_MLMGEN.setflags(write=False)
+
+# Pairwise radius-sum tables (COV_SUM[zi, zj] == radii[zi] + radii[zj]).
+# Precomputed once at import time so that bond/distance checks need only
+# a single indexed load per atom pair instead of two gathers and an add.
+COV_SUM_PYYKKO = COV_RADII_PYYKKO[:, None] + COV_RADII_PYYKKO[None, :]
+COV_SUM_PYYKKO.setflags(write=False)
+COV_SUM_MLMGEN = COV_RADII_MLMGEN[:, None] + COV_RADII_MLMGEN[None, :]
+COV_SUM_MLMGEN.setflags(write=False)
@@ -2,6 +2,6 @@
 This module is the entry point for the main generator module.
 """
 
-from .main import generator
+from .main import generator, generate_molecules
 
-__all__ = ["generator"]
+__all__ = ["generator", "generate_molecules"]
@@ -5,11 +5,24 @@ Main driver of MindlessGen.
 from __future__ import annotations
 
 # Python standard library
-from collections.abc import Callable
-from concurrent.futures import Future, as_completed
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import nullcontext
+from itertools import islice
+import ctypes
+import os
 from pathlib import Path
 import multiprocessing as mp
-from threading import Event
+from multiprocessing.managers import SyncManager
+from queue import Queue
+from threading import Thread
 import warnings
 from time import perf_counter
 from datetime import timedelta
@@ -38,6 +51,7 @@ from ..prog import (
     setup_managers,
     ResourceMonitor,
     setup_blocks,
+    StopFlag,
 )
 from ..symmetrization import (
     Symmetrizer,
@@ -49,6 +63,59 @@ from ..__version__ import __version__
 
 MINDLESS_MOLECULES_FILE = "mindless.molecules"
 
+# Static per-run state, shipped once per worker process via the executor
+# initializer instead of being repickled for every submitted task
+_worker_state: dict = {}
+
+
+def _init_worker(
+    stop_flags,
+    config: ConfigManager,
+    refine_engine: QMMethod,
+    postprocess_engine: QMMethod | None,
+    structure_mod_model: Symmetrizer | None,
+) -> None:
+    """
+    Store the fork-inherited per-run state in the worker process.
+    """
+    _worker_state["stop_flags"] = stop_flags
+    _worker_state["config"] = config
+    _worker_state["refine_engine"] = refine_engine
+    _worker_state["postprocess_engine"] = postprocess_engine
+    _worker_state["structure_mod_model"] = structure_mod_model
+
+
+def _warm_worker(barrier) -> None:
+    """
+    Block until every worker of the shared process pool has been forked.
+    Submitted once per core before any coordinator thread starts, so that
+    all workers are created while the main process is still single-threaded.
+    """
+    barrier.wait()
+
+
+def _xyz_writer(
+    io_queue: Queue[Molecule | None],
+    molecules_file,
+    verbosity: int,
+    errors: list[Exception],
+) -> None:
+    """
+    Write queued molecules to disk until the None sentinel arrives.
+    A write failure is recorded for the drain loop to re-raise; the queue is
+    still drained afterwards so the bounded put() can never block the producer.
+    """
+    try:
+        while (molecule := io_queue.get()) is not None:
+            molecule.write_xyz_to_file()
+            molecules_file.write(f"mlm_{molecule.name}\n")
+            if verbosity > 0:
+                print(f"Written molecule file 'mlm_{molecule.name}.xyz'.\n")
+    except Exception as e:  # pylint: disable=broad-except
+        errors.append(e)
+        while io_queue.get() is not None:
+            pass
+
 
 def generator(config: ConfigManager) -> tuple[list[Molecule], int]:
     """
@@ -73,6 +140,41 @@ def generator(config: ConfigManager) -> tuple[list[Molecule], int]:
         print(config)
         return [], 0
 
+    exitcode = 0
+    optimized_molecules: list[Molecule] = []
+    for molecule in generate_molecules(config):
+        if molecule is not None:
+            optimized_molecules.append(molecule)
+        else:
+            exitcode = 1
+
+    end = perf_counter()
+    runtime = end - start
+
+    print(f"\nSuccessfully generated {len(optimized_molecules)} molecules:")
+    for optimized_molecule in optimized_molecules:
+        print(optimized_molecule.name)
+
+    time = timedelta(seconds=int(runtime))
+    hours, r = divmod(time.seconds, 3600)
+    minutes, seconds = divmod(r, 60)
+    if time.days:
+        hours += time.days * 24
+
+    print(f"\nRan MindlessGen in {hours:02d}:{minutes:02d}:{seconds:02d} (HH:MM:SS)")
+
+    return optimized_molecules, exitcode
+
+
+def generate_molecules(config: ConfigManager) -> Iterator[Molecule | None]:
+    """
+    Stream the molecule generation: set up the engines and the parallel
+    environment, then yield one result per requested molecule as soon as it
+    finishes (None for a failed generation). Callers that do not accumulate
+    the yielded molecules keep peak memory at the number of in-flight
+    molecules instead of the whole run.
+    """
+
     # Import and set up required engines
     refine_engine: QMMethod = setup_engines(
         config.refine.engine,
@@ -108,7 +210,13 @@ def generator(config: ConfigManager) -> tuple[list[Molecule], int]:
 
     config.check_config(verbosity=config.general.verbosity)
 
-    num_cores = min(mp.cpu_count(), config.general.parallel)
+    # Respect the CPU affinity mask (cgroups, SLURM, taskset) where available
+    # instead of the node-wide core count to avoid oversubscription
+    if hasattr(os, "sched_getaffinity"):
+        avail_cores = len(os.sched_getaffinity(0))
+    else:
+        avail_cores = mp.cpu_count()
+    num_cores = min(avail_cores, config.general.parallel)
     if config.general.verbosity > 0:
         print(f"Running with {num_cores} cores.")
 
@@ -117,16 +225,12 @@ def generator(config: ConfigManager) -> tuple[list[Molecule], int]:
         if config.general.verbosity > 0:
             print(f"\n--- Appending to existing file '{MINDLESS_MOLECULES_FILE}'. ---")
 
-    exitcode = 0
-    optimized_molecules: list[Molecule] = []
-
-    # Initialize parallel blocks here
+    # Initialize parallel blocks here (sorted by ascending ncores)
     blocks = setup_blocks(
         num_cores,
         config.general.num_molecules,
         max(config.refine.ncores, config.postprocess.ncores),
     )
-    blocks.sort(key=lambda x: x.ncores)
 
     backup_verbosity: int | None = None
     if len(blocks) > 1 and config.general.verbosity > 0:
@@ -134,85 +238,149 @@ def generator(config: ConfigManager) -> tuple[list[Molecule], int]:
         config.general.verbosity = 0  # Disable verbosity if parallel
         # NOTE: basically no messages will be printed if generation is run in parallel
 
+    # Shared-memory per-molecule stop flags: checking or setting one is a plain
+    # memory access in the workers instead of an IPC round-trip per call
+    stop_flags = mp.Array(ctypes.c_bool, config.general.num_molecules, lock=False)
+
     # Set up parallel blocks environment
-    with setup_managers(num_cores // blocks[0].ncores, num_cores) as (
+    # A single process pool is shared by all molecule generations; the per-molecule
+    # coordination runs in cheap threads instead of forking a pool per molecule
+    with setup_managers(
+        num_cores,
+        num_cores,
+        initializer=_init_worker,
+        initargs=(
+            stop_flags,
+            config,
+            refine_engine,
+            postprocess_engine,
+            structure_mod_model,
+        ),
+    ) as (
         executor,
-        _,
+        manager,
         resources,
     ):
-        # The following creates a queue of futures which occupy a certain number of cores each
-        # as defined by each block
-        # Each future represents the generation of one molecule
-        # NOTE: proceeding this way assures that each molecule gets a static number of cores
-        # a dynamic setting would also be thinkable and straightforward to implement
-        tasks: list[Future[Molecule | None]] = []
-        for block in blocks:
-            # Every block is tasked to find block.num_molecules sequentially,
-            # For every block there is only one single_molecule_generator active
-            # (the others wait for resources)
-            for _ in range(block.num_molecules):
-                tasks.append(
-                    executor.submit(
-                        single_molecule_generator,
-                        len(tasks),
-                        config,
-                        resources,
-                        refine_engine,
-                        postprocess_engine,
-                        structure_mod_model,
-                        block.ncores,
-                    )
+        # Fork the full worker pool up front, while the main process is still
+        # single-threaded: the barrier tasks only return once every worker
+        # exists, so no worker is forked later from under the coordinator
+        # threads (forking a multi-threaded process risks deadlocks on
+        # inherited locks and is deprecated from Python 3.12 on)
+        warmup_barrier = manager.Barrier(num_cores)
+        wait([executor.submit(_warm_worker, warmup_barrier) for _ in range(num_cores)])
+
+        with ThreadPoolExecutor(
+            max_workers=num_cores // blocks[0].ncores
+        ) as coordinator:
+            # The following creates a queue of futures which occupy a certain number of cores each
+            # as defined by each block
+            # Each future represents the generation of one molecule
+            # NOTE: proceeding this way assures that each molecule gets a static number of cores
+            # a dynamic setting would also be thinkable and straightforward to implement
+            def submit_molecule_tasks():
+                molcount = 0
+                for block in blocks:
+                    # Every block is tasked to find block.num_molecules sequentially,
+                    # For every block there is only one single_molecule_generator active
+                    # (the others wait for resources)
+                    for _ in range(block.num_molecules):
+                        yield coordinator.submit(
+                            single_molecule_generator,
+                            molcount,
+                            config,
+                            executor,
+                            manager,
+                            # With a single block only one molecule runs at a time,
+                            # so the outer core gate has no contention and its
+                            # manager round-trips can be skipped entirely
+                            resources if len(blocks) > 1 else None,
+                            block.ncores,
+                        )
+                        molcount += 1
+
+            # Collect results of all tries to create a molecule
+            # No task list is kept here: as_completed owns the future references and
+            # releases each one as soon as it has been drained
+            # Each molecule is written out as soon as its future completes so that
+            # I/O overlaps with the remaining QM work instead of waiting for all tasks
+            molecules_file = None
+            io_queue: Queue[Molecule | None] | None = None
+            io_thread: Thread | None = None
+            io_errors: list[Exception] = []
+            if config.general.write_xyz:
+                # One buffered handle for the whole run: the per-molecule lines
+                # coalesce into block-sized writes instead of one syscall each
+                molecules_file = open(
+                    MINDLESS_MOLECULES_FILE, "a", encoding="utf8", buffering=1 << 16
                 )
-
-        # Collect results of all tries to create a molecule
-        for future in tqdm(
-            as_completed(tasks),
-            total=len(tasks),
-            desc="Generating Molecules ...",
-        ):
-            result: Molecule | None = future.result()
-            if result is not None:
-                optimized_molecules.append(result)
-            else:
-                exitcode = 1
+                # Single background writer thread: disk latency stays off the
+                # drain loop; the bounded queue provides backpressure
+                io_queue = Queue(maxsize=num_cores * 4)
+                io_thread = Thread(
+                    target=_xyz_writer,
+                    args=(
+                        io_queue,
+                        molecules_file,
+                        config.general.verbosity,
+                        io_errors,
+                    ),
+                    daemon=True,
+                )
+                io_thread.start()
+            try:
+                for future in tqdm(
+                    as_completed(submit_molecule_tasks()),
+                    total=config.general.num_molecules,
+                    desc="Generating Molecules ...",
+                ):
+                    result: Molecule | None = future.result()
+                    if result is not None and io_queue is not None:
+                        if io_errors:
+                            raise io_errors[0]
+                        io_queue.put(result)
+                    yield result
+            except BaseException:
+                # Abort cleanly on any error, Ctrl-C, or when the consumer
+                # abandons the iterator early: drop the not-yet-started molecules
+                # and raise every stop flag so the in-flight cycles return
+                # immediately instead of finishing their remaining QM work
+                coordinator.shutdown(wait=False, cancel_futures=True)
+                for i in range(len(stop_flags)):
+                    stop_flags[i] = True
+                raise
+            finally:
+                if io_queue is not None and io_thread is not None:
+                    io_queue.put(None)  # Sentinel to stop the writer thread
+                    io_thread.join()
+                if molecules_file is not None:
+                    molecules_file.close()
+            # Surface a write failure that occurred after the last put
+            if io_errors:
+                raise io_errors[0]
 
     # Restore verbosity level if it was changed
     if backup_verbosity is not None:
         config.general.verbosity = backup_verbosity
 
-    end = perf_counter()
-    runtime = end - start
-
-    print(f"\nSuccessfully generated {len(optimized_molecules)} molecules:")
-    for optimized_molecule in optimized_molecules:
-        print(optimized_molecule.name)
-
-    time = timedelta(seconds=int(runtime))
-    hours, r = divmod(time.seconds, 3600)
-    minutes, seconds = divmod(r, 60)
-    if time.days:
-        hours += time.days * 24
-
-    print(f"\nRan MindlessGen in {hours:02d}:{minutes:02d}:{seconds:02d} (HH:MM:SS)")
-
-    return optimized_molecules, exitcode
-
 
 def single_molecule_generator(
     molcount: int,
     config: ConfigManager,
-    resources: ResourceMonitor,
-    refine_engine: QMMethod,
-    postprocess_engine: QMMethod | None,
-    structure_mod_model: Symmetrizer,
+    executor: ProcessPoolExecutor,
+    manager: SyncManager,
+    resources: ResourceMonitor | None,
     ncores: int,
 ) -> Molecule | None:
     """
     Generate a single molecule (from start to finish). Returns None only if all cycles fail.
+    Passing resources=None skips the outer core gate (single-block runs).
     """
 
     # Wait for enough cores (cores freed automatically upon leaving managed context)
-    with resources.occupy_cores(ncores):
+    core_gate = (
+        resources.occupy_cores(ncores) if resources is not None else nullcontext()
+    )
+    with core_gate:
         # print a decent header for each molecule iteration
         if config.general.verbosity > 0:
             print(f"\n{'=' * 80}")
@@ -222,45 +390,50 @@ def single_molecule_generator(
             )
             print(f"{'=' * 80}")
 
-        with setup_managers(ncores, ncores) as (executor, manager, resources_local):
-            stop_event = manager.Event()
-            # Launch worker processes to find molecule
-            cycles = range(config.general.max_cycles)
-            tasks: list[Future[Molecule | None]] = []
-            for cycle in cycles:
-                tasks.append(
-                    executor.submit(
-                        single_molecule_step,
-                        config,
-                        resources_local,
-                        refine_engine,
-                        postprocess_engine,
-                        structure_mod_model,
-                        cycle,
-                        stop_event,
-                    )
-                )
+        # Reuse the shared process pool; only a lightweight per-molecule core
+        # budget is created instead of a dedicated pool and manager process
+        # for every molecule (the stop flag lives in fork-inherited memory)
+        resources_local = ResourceMonitor(manager, ncores)
 
-            results = [task.result() for task in as_completed(tasks)]
+        def submit_cycle(cycle: int) -> Future[Molecule | None]:
+            return executor.submit(
+                single_molecule_step, resources_local, cycle, molcount
+            )
 
-    optimized_molecule: Molecule | None = None
-    for i, result in enumerate(results):
-        if result is not None:
-            cycles_needed = i + 1
-            optimized_molecule = result
-            if config.general.verbosity > 0:
-                print(f"Optimized mindless molecule found in {cycles_needed} cycles.")
-                print(optimized_molecule)
-            break
-
-    # Write out molecule if requested
-    if optimized_molecule is not None and config.general.write_xyz:
-        optimized_molecule.write_xyz_to_file()
-        with open(MINDLESS_MOLECULES_FILE, "a", encoding="utf8") as f:
-            f.write(f"mlm_{optimized_molecule.name}\n")
-        if config.general.verbosity > 0:
-            print(f"Written molecule file 'mlm_{optimized_molecule.name}.xyz'.\n")
-    elif optimized_molecule is None:
+        # Launch worker processes to find molecule
+        # Cycles are submitted lazily in a window of ncores in-flight tasks so that
+        # an early success never pays the IPC round-trip for the remaining cycles
+        cycle_iter = iter(range(config.general.max_cycles))
+        pending: set[Future[Molecule | None]] = {
+            submit_cycle(cycle) for cycle in islice(cycle_iter, ncores)
+        }
+
+        optimized_molecule: Molecule | None = None
+        cycles_needed = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                cycles_needed += 1
+                result = task.result()
+                if result is not None:
+                    optimized_molecule = result
+                    break
+            if optimized_molecule is not None:
+                # Cancel all queued cycles and let the running ones drain
+                # (they exit early since the stop event is already set)
+                for task in pending:
+                    task.cancel()
+                wait(pending)
+                break
+            for cycle in islice(cycle_iter, len(done)):
+                pending.add(submit_cycle(cycle))
+
+    if optimized_molecule is not None and config.general.verbosity > 0:
+        print(f"Optimized mindless molecule found in {cycles_needed} cycles.")
+        print(optimized_molecule)
+
+    # Writing the molecule out is handled by the caller as soon as this task completes
+    if optimized_molecule is None:
         warnings.warn(
             "Molecule generation including optimization (and postprocessing) "
             + f"failed for all cycles for molecule {molcount + 1}."
@@ -270,26 +443,31 @@ def single_molecule_generator(
 
 
 def single_molecule_step(
-    config: ConfigManager,
     resources_local: ResourceMonitor,
-    refine_engine: QMMethod,
-    postprocess_engine: QMMethod | None,
-    structure_mod_model: Symmetrizer,
     cycle: int,
-    stop_event: Event,
+    molcount: int,
 ) -> Molecule | None:
     """
     Execute one step in a single molecule generation.
+    The static per-run inputs (config, engines, structure modification model)
+    are taken from the worker state installed by the executor initializer.
     Returns None if
-    ... stop_event is set at any point.
+    ... the stop flag of this molecule is set at any point.
     ... if the molecule generation failed for this trial.
     """
 
+    config: ConfigManager = _worker_state["config"]
+    refine_engine: QMMethod = _worker_state["refine_engine"]
+    postprocess_engine: QMMethod | None = _worker_state["postprocess_engine"]
+    structure_mod_model: Symmetrizer = _worker_state["structure_mod_model"]
+    stop_event = StopFlag(_worker_state["stop_flags"], molcount)
     if stop_event.is_set():
         return None  # Exit early if a molecule has already been found
 
     if config.general.verbosity > 0:
-        print(f"Starting cycle {cycle + 1:<3}...")
+        # Flush so the message is not stuck in the worker's stdout buffer
+        # while the QM step runs
+        print(f"Starting cycle {cycle + 1:<3}...", flush=True)
 
     #   _____                           _
     #  / ____|                         | |
@@ -404,29 +582,40 @@ def single_molecule_step(
         return None
 
 
+# Static banner, built once at import time; only the version is substituted
+_HEADER_TEMPLATE = (
+    # pylint: disable=C0301
+    "╔══════════════════════════════════════════════════════════════════════════════════════════════════╗\n"
+    "║                                                                                                  ║\n"
+    "║   ███╗   ███╗██╗███╗   ██╗██████╗ ██╗     ███████╗███████╗███████╗ ██████╗ ███████╗███╗   ██╗    ║\n"
+    "║   ████╗ ████║██║████╗  ██║██╔══██╗██║     ██╔════╝██╔════╝██╔════╝██╔════╝ ██╔════╝████╗  ██║    ║\n"
+    "║   ██╔████╔██║██║██╔██╗ ██║██║  ██║██║     █████╗  ███████╗███████╗██║  ███╗█████╗  ██╔██╗ ██║    ║\n"
+    "║   ██║╚██╔╝██║██║██║╚██╗██║██║  ██║██║     ██╔══╝  ╚════██║╚════██║██║   ██║██╔══╝  ██║╚██╗██║    ║\n"
+    "║   ██║ ╚═╝ ██║██║██║ ╚████║██████╔╝███████╗███████╗███████║███████║╚██████╔╝███████╗██║ ╚████║    ║\n"
+    "║   ╚═╝     ╚═╝╚═╝╚═╝  ╚═══╝╚═════╝ ╚══════╝╚══════╝╚══════╝╚══════╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝    ║\n"
+    "║                                                                                                  ║\n"
+    "║%s║\n"
+    "║                                 Semi-Automated Molecule Generator                                ║\n"
+    "║                                                                                                  ║\n"
+    "║                          Licensed under the Apache License, Version 2.0                          ║\n"
+    "║                           (http://www.apache.org/licenses/LICENSE-2.0)                           ║\n"
+    "╚══════════════════════════════════════════════════════════════════════════════════════════════════╝"
+)
+
+
 def header(version: str) -> str:
     """
     This function prints the header of the program.
     """
-    headerstr = (
-        # pylint: disable=C0301
-        "╔══════════════════════════════════════════════════════════════════════════════════════════════════╗\n"
-        "║                                                                                                  ║\n"
-        "║   ███╗   ███╗██╗███╗   ██╗██████╗ ██╗     ███████╗███████╗███████╗ ██████╗ ███████╗███╗   ██╗    ║\n"
-        "║   ████╗ ████║██║████╗  ██║██╔══██╗██║     ██╔════╝██╔════╝██╔════╝██╔════╝ ██╔════╝████╗  ██║    ║\n"
-        "║   ██╔████╔██║██║██╔██╗ ██║██║  ██║██║     █████╗  ███████╗███████╗██║  ███╗█████╗  ██╔██╗ ██║    ║\n"
-        "║   ██║╚██╔╝██║██║██║╚██╗██║██║  ██║██║     ██╔══╝  ╚════██║╚════██║██║   ██║██╔══╝  ██║╚██╗██║    ║\n"
-        "║   ██║ ╚═╝ ██║██║██║ ╚████║██████╔╝███████╗███████╗███████║███████║╚██████╔╝███████╗██║ ╚████║    ║\n"
-        "║   ╚═╝     ╚═╝╚═╝╚═╝  ╚═══╝╚═════╝ ╚══════╝╚══════╝╚══════╝╚══════╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝    ║\n"
-        "║                                                                                                  ║\n"
-        f"║                                       MindlessGen v{version[:5]}                                         ║\n"
-        "║                                 Semi-Automated Molecule Generator                                ║\n"
-        "║                                                                                                  ║\n"
-        "║                          Licensed under the Apache License, Version 2.0                          ║\n"
-        "║                           (http://www.apache.org/licenses/LICENSE-2.0)                           ║\n"
-        "╚══════════════════════════════════════════════════════════════════════════════════════════════════╝"
-    )
-    return headerstr
+    # Keep only the release part of the version; centering keeps the banner
+    # aligned for release parts of any length (e.g. "1.2.10")
+    release = str(version).split("+", maxsplit=1)[0].split(".dev", maxsplit=1)[0]
+    return _HEADER_TEMPLATE % f"MindlessGen v{release}".center(98)
+
+
+# Cache of constructed engines, keyed by engine type and the configured
+# binary paths so that changing a path in the config yields a fresh engine
+_engine_cache: dict[tuple, QMMethod] = {}
 
 
 # Define a utility function to set up the required engine
@@ -441,24 +630,37 @@ def setup_engines(
 ):
     """
     Set up the required engine.
+    Cached per engine type and configured binary path, so repeated calls
+    do not probe the file system for the binaries again.
     """
+    engine: QMMethod
+    cache_key: tuple[str, ...]
     if engine_type == "xtb":
+        cache_key = (engine_type, cfg.xtb.xtb_path)
+        if cache_key in _engine_cache:
+            return _engine_cache[cache_key]
         try:
             path = xtb_path_func(cfg.xtb.xtb_path)
             if not path:
                 raise ImportError("xtb not found.")
         except ImportError as e:
             raise ImportError("xtb not found.") from e
-        return XTB(path, cfg.xtb)
+        engine = XTB(path, cfg.xtb)
     elif engine_type == "orca":
+        cache_key = (engine_type, cfg.orca.orca_path)
+        if cache_key in _engine_cache:
+            return _engine_cache[cache_key]
         try:
             path = orca_path_func(cfg.orca.orca_path)
             if not path:
                 raise ImportError("orca not found.")
         except ImportError as e:
             raise ImportError("orca not found.") from e
-        return ORCA(path, cfg.orca)
+        engine = ORCA(path, cfg.orca)
     elif engine_type == "turbomole":
+        cache_key = (engine_type, cfg.turbomole.jobex_path, cfg.turbomole.ridft_path)
+        if cache_key in _engine_cache:
+            return _engine_cache[cache_key]
         try:
             jobex_path = jobex_path_func(cfg.turbomole.jobex_path)
             if not jobex_path:
@@ -471,16 +673,21 @@ def setup_engines(
                 raise ImportError("ridft not found.")
         except ImportError as e:
             raise ImportError("ridft not found.") from e
-        return Turbomole(jobex_path, ridft_path, cfg.turbomole)
+        engine = Turbomole(jobex_path, ridft_path, cfg.turbomole)
     elif engine_type == "gxtb":
+        cache_key = (engine_type, cfg.gxtb.gxtb_path)
+        if cache_key in _engine_cache:
+            return _engine_cache[cache_key]
         if gxtb_path_func is None:
             raise ImportError("No callable function for determining the g-xTB path.")
         path = gxtb_path_func(cfg.gxtb.gxtb_path)
         if not path:
             raise ImportError("'gxtb' binary could not be found.")
-        return GXTB(path, cfg.gxtb)
+        engine = GXTB(path, cfg.gxtb)
     else:
         raise NotImplementedError("Engine not implemented.")
+    _engine_cache[cache_key] = engine
+    return engine
 
 
 def setup_structure_modification_model(
@@ -8,7 +8,7 @@ from ..prog import GenerateConfig
 from .molecule import Molecule
 from ..data.parameters import MAX_ELEM
 from .miscellaneous import (
-    get_cov_radii,
+    get_cov_sum_table,
     set_random_charge,
     calculate_protons,
     get_alkali_metals,
@@ -406,13 +406,12 @@ def check_distances(
     """
     Check if the distances between atoms are larger than a threshold.
     """
+    cov_sum = get_cov_sum_table(COV_RADII)
     # go through the atoms dimension of the xyz array
     for i in range(xyz.shape[0] - 1):
         for j in range(i + 1, xyz.shape[0]):
             r = np.linalg.norm(xyz[i, :] - xyz[j, :])
-            sum_radii = get_cov_radii(ati[i], COV_RADII) + get_cov_radii(
-                ati[j], COV_RADII
-            )
+            sum_radii = cov_sum[ati[i], ati[j]]
             if r < scale_minimal_distance * sum_radii:
                 return False
     return True
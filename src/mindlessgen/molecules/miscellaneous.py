@@ -5,7 +5,12 @@ Molecule-related helper tools.
 import numpy as np
 
 from .molecule import ati_to_atlist
-from ..data.parameters import COV_RADII_PYYKKO, COV_RADII_MLMGEN
+from ..data.parameters import (
+    COV_RADII_PYYKKO,
+    COV_RADII_MLMGEN,
+    COV_SUM_PYYKKO,
+    COV_SUM_MLMGEN,
+)
 
 
 def get_cov_radii(at: int, vdw_radii: str = "mlmgen") -> float:
@@ -21,6 +26,17 @@ def get_cov_radii(at: int, vdw_radii: str = "mlmgen") -> float:
     return rcov[at]
 
 
+def get_cov_sum_table(vdw_radii: str = "mlmgen") -> np.ndarray:
+    """
+    Get the precomputed pairwise radius-sum table (table[zi, zj] in Angstrom).
+    """
+    if vdw_radii == "mlmgen":
+        return COV_SUM_MLMGEN
+    if vdw_radii == "pyykko":
+        return COV_SUM_PYYKKO
+    raise ValueError("Invalid vdw_radii argument.")
+
+
 def set_random_charge(
     ati: np.ndarray,
     verbosity: int = 1,
@@ -2,10 +2,9 @@
 Postprocess the generated molecules.
 """
 
-from threading import Event
 from .molecule import Molecule
 from ..qm import QMMethod
-from ..prog import PostProcessConfig, ResourceMonitor
+from ..prog import PostProcessConfig, ResourceMonitor, StopFlag
 
 
 def postprocess_mol(
@@ -13,7 +12,7 @@ def postprocess_mol(
     engine: QMMethod,
     config: PostProcessConfig,
     resources_local: ResourceMonitor,
-    stop_event: Event,
+    stop_event: StopFlag,
     verbosity: int = 1,
 ) -> Molecule | None:
     """
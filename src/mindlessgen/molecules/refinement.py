@@ -3,17 +3,17 @@ This module handles all optimization and fragment detection steps
 to obtain finally a valid molecule.
 """
 
-from threading import Event
 import warnings
 from pathlib import Path
 import networkx as nx  # type: ignore
 import numpy as np
 
 from ..qm.base import QMMethod
-from ..prog import GenerateConfig, RefineConfig, ResourceMonitor
+from ..prog import GenerateConfig, RefineConfig, ResourceMonitor, StopFlag
 from .molecule import Molecule
 from .miscellaneous import (
     get_cov_radii,
+    get_cov_sum_table,
     set_random_charge,
     calculate_protons,
     calculate_ligand_electrons,
@@ -31,7 +31,7 @@ def iterative_optimization(
     config_generate: GenerateConfig,
     config_refine: RefineConfig,
     resources_local: ResourceMonitor,
-    stop_event: Event,
+    stop_event: StopFlag,
     verbosity: int = 1,
 ) -> Molecule | None:
     """
@@ -209,12 +209,11 @@ def detect_fragments(
     graph.add_nodes_from(range(mol.num_atoms))
 
     # Calculate pairwise distances and add edges if atoms are bonded
+    cov_sum = get_cov_sum_table(COV_RADII)
     for i in range(mol.num_atoms - 1):
         for j in range(i + 1, mol.num_atoms):
             distance = np.linalg.norm(mol.xyz[i] - mol.xyz[j])
-            sum_radii = get_cov_radii(mol.ati[i], COV_RADII) + get_cov_radii(
-                mol.ati[j], COV_RADII
-            )
+            sum_radii = cov_sum[mol.ati[i], mol.ati[j]]
             if verbosity > 2:
                 print(f"Distance between atom {i} and {j}: {distance:6.3f}")
                 print(
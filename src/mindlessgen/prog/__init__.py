@@ -15,7 +15,7 @@ from .config import (
     PostProcessConfig,
     SymmetrizationConfig,
 )
-from .parallel import setup_managers, ResourceMonitor, setup_blocks
+from .parallel import setup_managers, ResourceMonitor, setup_blocks, StopFlag
 
 __all__ = [
     "ConfigManager",
@@ -30,5 +30,6 @@ __all__ = [
     "setup_managers",
     "ResourceMonitor",
     "setup_blocks",
+    "StopFlag",
     "SymmetrizationConfig",
 ]
@@ -1,13 +1,23 @@
+import ctypes
+from bisect import bisect_right
+from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor
 from multiprocessing.managers import SyncManager
-from multiprocessing import Manager
+from multiprocessing import Array, Manager
 from contextlib import contextmanager
 from dataclasses import dataclass
 
 
 @contextmanager
-def setup_managers(max_workers: int, ncores: int):
-    executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=max_workers)
+def setup_managers(
+    max_workers: int,
+    ncores: int,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+):
+    executor: ProcessPoolExecutor = ProcessPoolExecutor(
+        max_workers=max_workers, initializer=initializer, initargs=initargs
+    )
     manager: SyncManager = Manager()
     resource_manager: ResourceMonitor = ResourceMonitor(manager, ncores)
     try:
@@ -17,6 +27,27 @@ def setup_managers(max_workers: int, ncores: int):
         manager.shutdown()
 
 
+class StopFlag:
+    """
+    Event-like stop signal backed by one entry of a shared-memory flag array.
+    Checking or setting the flag is a plain memory access instead of an IPC
+    round-trip to a manager process. The array has to reach worker processes
+    via fork inheritance (e.g. through an executor initializer), not pickling.
+    """
+
+    def __init__(self, flags=None, index: int = 0):
+        if flags is None:
+            flags = Array(ctypes.c_bool, 1, lock=False)
+        self.__flags = flags
+        self.__index = index
+
+    def is_set(self) -> bool:
+        return bool(self.__flags[self.__index])
+
+    def set(self) -> None:
+        self.__flags[self.__index] = True
+
+
 class ResourceMonitor:
     def __init__(self, manager: SyncManager, ncores: int):
         self.__free_cores = manager.Value(int, ncores)
@@ -42,6 +73,9 @@ class Block:
 
 
 def setup_blocks(ncores: int, num_molecules: int, mincores: int) -> list[Block]:
+    # The returned blocks are ordered by ascending ncores: the uniform split
+    # emits equally sized blocks and the divisor search below picks the largest
+    # admissible process count first, so ncores // p only grows
     blocks: list[Block] = []
 
     # Maximum and minimum number of parallel processes possible
@@ -49,26 +83,24 @@ def setup_blocks(ncores: int, num_molecules: int, mincores: int) -> list[Block]:
     maxprocs = max(1, ncores // mincores)
     minprocs = 1
 
-    # Distribute number of molecules among blocks
-    # First (if possible) create the maximum number of parallel blocks (maxprocs) and distribute as many molecules as possible
-    molecules_left = num_molecules
-    if molecules_left >= maxprocs:
-        p = maxprocs
-        molecules_per_block = molecules_left // p
-        for _ in range(p):
-            blocks.append(Block(molecules_per_block, ncores // p))
-        molecules_left -= molecules_per_block * p
+    # Common case: at least one molecule per parallel block
+    # The remainder is spread over the first blocks (one extra molecule each)
+    # so the whole run stays at maximum parallelism
+    if num_molecules >= maxprocs:
+        molecules_per_block, remainder = divmod(num_molecules, maxprocs)
+        return [
+            Block(molecules_per_block + (1 if i < remainder else 0), ncores // maxprocs)
+            for i in range(maxprocs)
+        ]
 
-    # While there are more than minprocs (1) molecules left find the optimal number of parallel blocks
-    # Again distribute as many molecules per block as possible
+    # Fewer molecules than parallel blocks: find the optimal number of parallel blocks
+    # among the divisors of ncores and distribute as many molecules per block as possible
+    # The divisors are precomputed once (ascending) so the largest admissible one
+    # can be found by bisection
+    divisors = [j for j in range(minprocs, maxprocs) if ncores % j == 0]
+    molecules_left = num_molecules
     while molecules_left >= minprocs:
-        p = max(
-            [
-                j
-                for j in range(minprocs, maxprocs)
-                if ncores % j == 0 and j <= molecules_left
-            ]
-        )
+        p = divisors[bisect_right(divisors, molecules_left) - 1]
         molecules_per_block = molecules_left // p
         for _ in range(p):
             blocks.append(Block(molecules_per_block, ncores // p))
@@ -11,7 +11,7 @@ from mindlessgen.prog import ConfigManager, GenerateConfig  # type: ignore
 from mindlessgen.molecules import detect_fragments  # type: ignore
 from mindlessgen.molecules import Molecule  # type: ignore
 from mindlessgen.molecules import iterative_optimization  # type: ignore
-from mindlessgen.prog.parallel import setup_managers
+from mindlessgen.prog.parallel import setup_managers, StopFlag
 from mindlessgen.qm import XTB, get_xtb_path  # type: ignore
 
 TESTSDIR = Path(__file__).resolve().parents[1]
@@ -145,7 +145,7 @@ def test_iterative_optimization(mol_C13H14: Molecule, mol_C7H8: Molecule) -> Non
         raise NotImplementedError("Engine not implemented.")
     mol = mol_C13H14
     with setup_managers(1, 1) as (_, manager, resources):
-        stop_event = manager.Event()
+        stop_event = StopFlag()
         mol_opt = iterative_optimization(
             mol,
             engine,
@@ -0,0 +1,58 @@
+"""
+Test the parallelization helpers in the prog module.
+"""
+
+import pytest
+from mindlessgen.prog import setup_blocks  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "ncores, num_molecules, mincores",
+    [
+        (1, 1, 1),
+        (4, 1, 1),
+        (4, 10, 1),
+        (6, 4, 2),
+        (8, 11, 2),
+        (12, 5, 4),
+        (16, 3, 4),
+        (32, 100, 6),
+    ],
+)
+def test_setup_blocks_invariants(
+    ncores: int, num_molecules: int, mincores: int
+) -> None:
+    """
+    The blocks have to cover all requested molecules and be ordered by
+    ascending ncores; generate_molecules relies on both properties when
+    sizing the coordinator thread pool from the first block.
+    """
+    blocks = setup_blocks(ncores, num_molecules, mincores)
+    assert sum(block.num_molecules for block in blocks) == num_molecules
+    block_cores = [block.ncores for block in blocks]
+    assert block_cores == sorted(block_cores)
+    assert all(mincores <= cores <= ncores for cores in block_cores)
+
+
+def test_setup_blocks_uniform_split() -> None:
+    """
+    With at least one molecule per parallel process the molecules are split
+    uniformly: one equally sized block per process, with the remainder spread
+    over the first blocks (one extra molecule each).
+    """
+    # 8 cores with at least 2 cores per molecule allow 4 parallel processes
+    blocks = setup_blocks(8, 11, 2)
+    assert [block.ncores for block in blocks] == [2, 2, 2, 2]
+    # divmod(11, 4) == (2, 3): the first three blocks get one extra molecule
+    assert [block.num_molecules for block in blocks] == [3, 3, 3, 2]
+
+
+def test_setup_blocks_fewer_molecules_than_processes() -> None:
+    """
+    With fewer molecules than parallel processes each molecule gets its own
+    block and the available cores are distributed over the molecules.
+    """
+    blocks = setup_blocks(8, 3, 2)
+    assert len(blocks) == 3
+    assert sum(block.num_molecules for block in blocks) == 3
+    assert all(block.num_molecules == 1 for block in blocks)